@@ -2,17 +2,20 @@ import os
 import sys
 import base64
 import ctypes
+import re
+import threading
 import time
-import markdown
 from pathlib import Path
 
-from openai import OpenAI
+import httpx
+from openai import OpenAI, DefaultHttpxClient
 
 from PySide6.QtCore import (
-    Qt, QRect, QPoint, QBuffer, QByteArray, QIODevice, Signal, QObject, QTimer, QThread, Slot, QAbstractNativeEventFilter
+    Qt, QRect, QPoint, QBuffer, QByteArray, QIODevice, Signal, QObject, QTimer, QRunnable, QThreadPool, QThread
 )
 from PySide6.QtGui import (
-    QGuiApplication, QPainter, QColor, QPen, QCursor, QKeySequence, QShortcut, QPixmap, QAction
+    QGuiApplication, QPainter, QColor, QPen, QCursor, QKeySequence, QShortcut, QPixmap, QImage, QRegion,
+    QAction, QTextCursor, QPalette, QTextOption
 )
 from PySide6.QtWidgets import (
     QApplication, QWidget, QSystemTrayIcon, QMenu, QLabel, QStyle, QTextBrowser
@@ -21,22 +24,51 @@ from PySide6.QtWidgets import (
 from dotenv import load_dotenv
 from ctypes import wintypes
 
+try:
+    from pybase64 import b64encode_as_string  # SIMD base64
+except ImportError:
+    def b64encode_as_string(data) -> str:
+        return base64.b64encode(data).decode("ascii")
+
 load_dotenv()
 
 # --- Windows global hotkey setup ---
+WM_QUIT     = 0x0012
 WM_HOTKEY   = 0x0312
+WM_USER     = 0x0400
+PM_NOREMOVE = 0x0000
 MOD_ALT     = 0x0001
 MOD_CONTROL = 0x0002
 VK_SNAPSHOT = 0x2C   # Print Screen
+VK_F9       = 0x78
 HOTKEY_ID   = 1      # any non-zero id
 
+# Tried in order until one registers
+HOTKEYS = [
+    (MOD_CONTROL | MOD_ALT, VK_SNAPSHOT, "Ctrl+Alt+PrtScr"),
+    (MOD_CONTROL | MOD_ALT, VK_F9, "Ctrl+Alt+F9"),
+]
+
 user32 = ctypes.windll.user32
-RegisterHotKey   = user32.RegisterHotKey
-UnregisterHotKey = user32.UnregisterHotKey
-RegisterHotKey.argtypes   = [wintypes.HWND, wintypes.INT, wintypes.UINT, wintypes.UINT]
-RegisterHotKey.restype    = wintypes.BOOL
-UnregisterHotKey.argtypes = [wintypes.HWND, wintypes.INT]
-UnregisterHotKey.restype  = wintypes.BOOL
+kernel32 = ctypes.windll.kernel32
+RegisterHotKey     = user32.RegisterHotKey
+UnregisterHotKey   = user32.UnregisterHotKey
+GetMessageW        = user32.GetMessageW
+PeekMessageW       = user32.PeekMessageW
+PostThreadMessageW = user32.PostThreadMessageW
+GetCurrentThreadId = kernel32.GetCurrentThreadId
+RegisterHotKey.argtypes     = [wintypes.HWND, wintypes.INT, wintypes.UINT, wintypes.UINT]
+RegisterHotKey.restype      = wintypes.BOOL
+UnregisterHotKey.argtypes   = [wintypes.HWND, wintypes.INT]
+UnregisterHotKey.restype    = wintypes.BOOL
+GetMessageW.argtypes        = [ctypes.POINTER(wintypes.MSG), wintypes.HWND, wintypes.UINT, wintypes.UINT]
+GetMessageW.restype         = wintypes.BOOL
+PeekMessageW.argtypes       = [ctypes.POINTER(wintypes.MSG), wintypes.HWND, wintypes.UINT, wintypes.UINT, wintypes.UINT]
+PeekMessageW.restype        = wintypes.BOOL
+PostThreadMessageW.argtypes = [wintypes.DWORD, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM]
+PostThreadMessageW.restype  = wintypes.BOOL
+GetCurrentThreadId.argtypes = []
+GetCurrentThreadId.restype  = wintypes.DWORD
 
 PROMPT_PATH = Path(__file__).with_name("prompt.md")
 
@@ -53,32 +85,164 @@ else:
     )
 
 OPENAI_MODEL = os.environ.get("OPENAI_VISION_MODEL", "gpt-4o")  # or gpt-4o-mini
+# "low" is a flat 512px pass: cheaper and faster, but it ignores MAX_IMAGE_SIDE
+# and struggles with small text, so it is opt-in
+OPENAI_IMAGE_DETAIL = os.environ.get("OPENAI_IMAGE_DETAIL", "auto")  # auto, high or low
+# Plenty for a screen region; keeps a runaway answer short. Reasoning models
+# spend part of this on reasoning tokens, so raise it for those.
+MAX_OUTPUT_TOKENS = int(os.environ.get("OPENAI_MAX_OUTPUT_TOKENS", "1024"))
+REPAINT_INTERVAL_MS = 16  # cap selection repaints at ~60 Hz while dragging
+RENDER_INTERVAL_MS = 33  # coalesce streamed chunks into one re-render per interval
+MAX_IMAGE_SIDE = 1536  # longest side (px) of the image sent to the API
+JPEG_QUALITY = 85
+# httpx closes idle connections after 5 s by default; translations are usually further apart
+KEEPALIVE_EXPIRY_S = 300
+
+DIM_ALPHA_SELECTING = 100  # desktop dimming while dragging
+DIM_ALPHA_BUSY = 150       # ... and while waiting for / showing the translation
+# Extra layer over the pre-dimmed grabs that brings DIM_ALPHA_SELECTING up to DIM_ALPHA_BUSY
+DIM_ALPHA_TOP_UP = round(255 - 255 * (255 - DIM_ALPHA_BUSY) / (255 - DIM_ALPHA_SELECTING))
+
+RESULT_LINK_COLOR = "#9cd3ff"
+
+# Characters that can change how already-rendered Markdown is laid out
+MD_SIGNIFICANT = re.compile(r"[\n`*_#|>\[\]()<&\\~]")
+
+
+def is_plain_append(md_text: str, start: int) -> bool:
+    """
+    True if md_text[start:] only extends the current line with plain text,
+    so it can be appended to the rendered document without re-parsing.
+    The end of the document must then be the end of that line, which is not
+    the case inside a table (Qt keeps an empty block after the table frame)
+    or after unclosed inline HTML.
+    """
+    if start == 0 or MD_SIGNIFICANT.search(md_text, start) or MD_SIGNIFICANT.match(md_text, start - 1):
+        return False
+    # Trailing whitespace is dropped when rendering, so it isn't in the document
+    if md_text[start - 1].isspace():
+        return False
+    # Table rows (with or without pipes) run until a blank line, and so can open tags
+    para_start = md_text.rfind("\n\n", 0, start) + 1
+    if "|" in md_text[para_start:start] or "<" in md_text[para_start:start]:
+        return False
+    # The line's block type (list, heading, ...) must already be settled
+    line_start = md_text.rfind("\n", 0, start) + 1
+    return any(c.isalpha() for c in md_text[line_start:start])
+
+
+def is_plain_text(md_text: str) -> bool:
+    """True if md_text is a single line of prose that renders the same with or without Markdown."""
+    return md_text[:1].isalpha() and MD_SIGNIFICANT.search(md_text) is None
+
+
+_client: OpenAI | None = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> OpenAI:
+    """
+    Shared OpenAI client. Its connection pool keeps idle connections for
+    KEEPALIVE_EXPIRY_S, so a follow-up translation skips the TCP/TLS handshake.
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = OpenAI(http_client=DefaultHttpxClient(limits=httpx.Limits(
+                max_connections=4, max_keepalive_connections=2, keepalive_expiry=KEEPALIVE_EXPIRY_S)))
+        return _client
+
+
+def warm_up_client():
+    """Build the client and import the lazily-loaded Responses API ahead of the first translation."""
+    try:
+        get_client().responses
+    except Exception:
+        pass  # e.g. a missing API key; the worker reports it when a translation runs
+
+
+class WinHotkeyThread(QThread):
+    """
+    Owns the global Windows hotkey. It is registered from this thread with no
+    window, so WM_HOTKEY lands in this thread's own message queue and Qt's
+    event loop never has to inspect native messages for it.
+    """
+    activated = Signal()
+    registered = Signal(str)  # name of the registered shortcut, "" if none could be registered
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._thread_id = 0
+
+    def run(self):
+        msg = wintypes.MSG()
+        PeekMessageW(ctypes.byref(msg), None, WM_USER, WM_USER, PM_NOREMOVE)  # make sure the queue exists
+        self._thread_id = GetCurrentThreadId()
+
+        name = ""
+        for mods, vk, label in HOTKEYS:
+            if RegisterHotKey(None, HOTKEY_ID, mods, vk):
+                name = label
+                break
+        self.registered.emit(name)
+
+        while GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+            if msg.message == WM_HOTKEY and msg.wParam == HOTKEY_ID:
+                self.activated.emit()
 
+        if name:
+            UnregisterHotKey(None, HOTKEY_ID)
 
-class WinHotkeyFilter(QAbstractNativeEventFilter):
-    """Listens for the global Windows hotkey and triggers a callback on the Qt thread."""
-    def __init__(self, on_hotkey):
-        super().__init__()
-        self.on_hotkey = on_hotkey
-
-    def nativeEventFilter(self, eventType, message):
-        if eventType.startsWith(b'windows_'):
-            msg = ctypes.wintypes.MSG.from_address(int(message))
-            if msg.message == WM_HOTKEY and msg.wParam == HOTKEY_ID:
-                QTimer.singleShot(0, self.on_hotkey)
-        return False, 0
+    def stop(self):
+        while self.isRunning():
+            if self._thread_id:
+                PostThreadMessageW(self._thread_id, WM_QUIT, 0, 0)
+            self.wait(100)
 
 
-class TranslatorWorker(QObject):
+class TranslatorSignals(QObject):
     chunk = Signal(str)     # partial streamed text
     done = Signal()         # finished without error
     error = Signal(str)     # error message
 
-    @Slot(bytes)
-    def run(self, png_bytes: bytes):
+
+class TranslatorWorker(QRunnable):
+    """
+    Encodes the capture and streams one translation on a QThreadPool thread,
+    reporting back through `signals`. Takes a QImage (not a QPixmap) so the
+    downscale and JPEG encode can safely run off the GUI thread.
+    """
+    def __init__(self, image: QImage):
+        super().__init__()
+        self.image: QImage | None = image
+        self.signals = TranslatorSignals()
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def _take_image_url(self) -> str:
+        """Encode self.image as a JPEG data URL, releasing the image on the way."""
+        img, self.image = self.image, None
+
+        # Don't send more pixels than the model can use
+        if max(img.width(), img.height()) > MAX_IMAGE_SIDE:
+            img = img.scaled(MAX_IMAGE_SIDE, MAX_IMAGE_SIDE, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+        ba = QByteArray()
+        buf = QBuffer(ba)
+        buf.open(QIODevice.WriteOnly)
+        img.save(buf, "JPG", JPEG_QUALITY)
+        buf.close()
+        del img
+
+        # Build the data URL in one go; memoryview avoids copying the QByteArray
+        return "data:image/jpeg;base64," + b64encode_as_string(memoryview(ba))
+
+    def run(self):
         try:
-            client = OpenAI()
-            b64 = base64.b64encode(png_bytes).decode("utf-8")
+            client = get_client()
+            image_url = self._take_image_url()
 
             with client.responses.stream(
                 model=OPENAI_MODEL,
@@ -86,20 +250,32 @@ class TranslatorWorker(QObject):
                     "role": "user",
                     "content": [
                         {"type": "input_text", "text": PROMPT_TEXT_MD},
-                        {"type": "input_image", "image_url": f"data:image/png;base64,{b64}"},
+                        {
+                            "type": "input_image",
+                            "image_url": image_url,
+                            "detail": OPENAI_IMAGE_DETAIL,
+                        },
                     ],
                 }],
                 timeout=60,
                 temperature=0.6,
+                max_output_tokens=MAX_OUTPUT_TOKENS,
             ) as stream:
+                # Every delta is emitted as it arrives; the overlay buffers them and
+                # renders at most once per RENDER_INTERVAL_MS, even if the stream stalls
                 for event in stream:
+                    if self._cancelled:
+                        return  # closes the stream
                     if event.type == "response.output_text.delta":
-                        self.chunk.emit(event.delta)
-                        time.sleep(0.04)  # gentle throttle so UI keeps up
-                _ = stream.get_final_response()  # ensures completion
-            self.done.emit()
+                        self.signals.chunk.emit(event.delta)
+                final = stream.get_final_response()  # ensures completion
+                if final.status == "incomplete":
+                    # Usually the MAX_OUTPUT_TOKENS cap; don't let a cut-off answer pass as complete
+                    self.signals.chunk.emit("\n\n*(truncated)*")
+            self.signals.done.emit()
         except Exception as e:
-            self.error.emit(f"Unexpected error: {e}")
+            if not self._cancelled:
+                self.signals.error.emit(f"Unexpected error: {e}")
 
 
 class Overlay(QWidget):
@@ -112,20 +288,28 @@ class Overlay(QWidget):
 
     def __init__(self):
         super().__init__(None, Qt.Window | Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool)
-        self.setAttribute(Qt.WA_TranslucentBackground, True)
+        # The frozen desktop covers the whole window, so it can be painted opaque
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
         self.setFocusPolicy(Qt.StrongFocus)
         self.setCursor(QCursor(Qt.CrossCursor))
         self.setMouseTracking(True)
 
-        self._frozen_pm: QPixmap | None = None
+        self._screen_grabs: list[tuple[QRect, QPixmap, QPixmap]] = []  # (screen geometry, frozen grab, dimmed grab)
         self._status_rect: QRect | None = None
+        self._vg = QRect()  # virtual desktop geometry, cached for the current session
         self.state = self.STATE_IDLE
         self.dragging = False
         self.start_pt = QPoint()
         self.end_pt = QPoint()
         self.selection = QRect()
+        self._last_paint_ns = 0
+        self._painted_sel = QRect()  # selection (widget coords) as of the last repaint request
         self._preview_pixmap: QPixmap | None = None
-        self._md_buffer: list[str] = []
+        self._preview_scaled: QPixmap | None = None  # _preview_pixmap scaled to _preview_scaled_size
+        self._preview_scaled_size: tuple[int, int] | None = None
+        self._md_text = ""                 # streamed Markdown rendered so far
+        self._md_pending: list[str] = []   # chunks received since the last render
+        self._worker: TranslatorWorker | None = None
 
         # Instruction label (top-left)
         self.instruction = QLabel(self)
@@ -156,11 +340,27 @@ class Overlay(QWidget):
         self.result = QTextBrowser(self)
         self.result.setOpenExternalLinks(True)
         self.result.setStyleSheet(
-            "QTextBrowser { color: white; background: rgba(0,0,0,150); font-size: 20px; padding: 16px; border-radius: 16px; }"
+            "QTextBrowser { color: white; background: rgba(0,0,0,150); font-size: 18px; padding: 16px; border-radius: 16px; }"
         )
+        palette = self.result.palette()
+        palette.setColor(QPalette.Link, QColor(RESULT_LINK_COLOR))
+        self.result.setPalette(palette)
+        self.result.document().setDefaultTextOption(QTextOption(Qt.AlignCenter))
         self.result.setFocusPolicy(Qt.NoFocus)
         self.result.hide()
 
+        # Re-render streamed Markdown at most once per interval
+        self._render_timer = QTimer(self)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.setInterval(RENDER_INTERVAL_MS)
+        self._render_timer.timeout.connect(self._on_render_timer)
+
+        # Repaint drag updates that arrive faster than REPAINT_INTERVAL_MS
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.setInterval(REPAINT_INTERVAL_MS)
+        self._repaint_timer.timeout.connect(self._update_selection_area)
+
         # Cover full virtual desktop
         vg = QGuiApplication.primaryScreen().virtualGeometry()
         self.setGeometry(vg)
@@ -187,31 +387,55 @@ class Overlay(QWidget):
 
     def _snapshot_virtual_desktop(self):
         """
-        Capture all screens and stitch them into a single QPixmap matching
-        the virtual desktop geometry.
+        Freeze every screen as its own QPixmap. Nothing is stitched into a
+        virtual-desktop-sized canvas; paintEvent and the capture read straight
+        from the per-screen grabs. A dimmed copy of each grab is rendered once
+        here so dragging doesn't alpha-blend the whole desktop on every frame.
         """
         try:
-            vg = QGuiApplication.primaryScreen().virtualGeometry()
-            if vg.isNull():
-                self._frozen_pm = None
-                return
-
-            canvas = QPixmap(vg.size())
-            canvas.fill(QColor(0, 0, 0, 255))
-
-            p = QPainter(canvas)
+            grabs = []
             for screen in QGuiApplication.screens():
-                sg = screen.geometry()
                 pm = screen.grabWindow(0)  # whole screen
-                p.drawPixmap(sg.topLeft() - vg.topLeft(), pm)
-            p.end()
-
-            self._frozen_pm = canvas
+                dimmed = QPixmap(pm)
+                p = QPainter(dimmed)
+                p.fillRect(dimmed.rect(), QColor(0, 0, 0, DIM_ALPHA_SELECTING))
+                p.end()
+                grabs.append((screen.geometry(), pm, dimmed))
+            self._screen_grabs = grabs
         except Exception:
-            self._frozen_pm = None
+            self._screen_grabs = []
+
+    @staticmethod
+    def _grab_source_rect(sg: QRect, pm: QPixmap, r: QRect) -> QRect:
+        """Map a global rect inside screen geometry `sg` to pixel coordinates of that screen's grab."""
+        sx = pm.width() / max(1, sg.width())
+        sy = pm.height() / max(1, sg.height())
+        return QRect(round((r.x() - sg.x()) * sx), round((r.y() - sg.y()) * sy),
+                     round(r.width() * sx), round(r.height() * sy))
+
+    def _detach_worker(self):
+        """Stop listening to (and cancel) a translation that is still running."""
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        self._worker.signals.chunk.disconnect(self._on_worker_chunk)
+        self._worker.signals.done.disconnect(self._on_worker_done)
+        self._worker.signals.error.disconnect(self._on_worker_error)
+        self._worker = None
+
+    def _from_current_worker(self) -> bool:
+        """
+        False for signals a detached worker had already queued before it was
+        disconnected; they must not touch an idle overlay or the next capture.
+        """
+        if self.state not in (self.STATE_WAITING, self.STATE_RESULT):
+            return False
+        return self._worker is not None and self.sender() is self._worker.signals
 
     # ---- Streaming UI updates ----
     def _on_worker_chunk(self, piece: str):
+        if not self._from_current_worker():
+            return
         if self.state != self.STATE_RESULT:
             # Switch to result view, keep preview visible
             self.state = self.STATE_RESULT
@@ -226,46 +450,56 @@ class Overlay(QWidget):
             self._focus_overlay()
             self.layoutFloatingWidgets()
 
-        # Buffer streamed text as Markdown
-        self._md_buffer.append(piece)
-        md_text = "".join(self._md_buffer)
-
-        # Convert Markdown -> HTML
-        html_body = markdown.markdown(
-            md_text,
-            extensions=["fenced_code", "tables", "sane_lists", "codehilite"]
-        )
+        # Buffer streamed text as Markdown. Throttle renders: the first chunk of a
+        # burst is drawn right away, the rest are picked up when the timer fires.
+        self._md_pending.append(piece)
+        if not self._render_timer.isActive():
+            self._flush_md()
+            self._render_timer.start()
+
+    def _on_render_timer(self):
+        # Keep ticking while text is still arriving; only a tick with nothing
+        # pending lets the next chunk render on the leading edge again
+        if self._md_pending:
+            self._flush_md()
+            self._render_timer.start()
+
+    def _flush_md(self, final: bool = False):
+        if self.state != self.STATE_RESULT or not (self._md_pending or final):
+            return
+        # One join per render, not per chunk
+        start = len(self._md_text)
+        self._md_text += "".join(self._md_pending)
+        self._md_pending.clear()
+        md_text = self._md_text
+        if not md_text:
+            return
 
-        themed_html = f"""
-        <html>
-        <head>
-        <meta charset="utf-8">
-        <style>
-            body {{
-                color: #ffffff; background: transparent; font-size: 18px; text-align: center;
-            }}
-            a {{ color: #9cd3ff; }}
-            code, pre {{ background: rgba(255,255,255,0.08); border-radius: 6px; padding: 0.2em 0.4em; }}
-            pre {{ padding: 12px; overflow-x: auto; }}
-            table {{ border-collapse: collapse; width: 100%; }}
-            th, td {{ border: 1px solid rgba(255,255,255,0.25); padding: 6px 8px; }}
-            h1, h2, h3, h4 {{ margin-top: 0.6em; }}
-            ul, ol {{ padding-left: 1.4em; }}
-        </style>
-        </head>
-        <body>{html_body}</body>
-        </html>
-        """
+        if not final and is_plain_append(md_text, start):
+            cursor = QTextCursor(self.result.document())
+            cursor.movePosition(QTextCursor.End)
+            cursor.insertText(md_text[start:])
+            return
 
-        self.result.setHtml(themed_html)
-        QApplication.processEvents()
+        if not final and is_plain_text(md_text):
+            self.result.document().setPlainText(md_text)
+        else:
+            self.result.document().setMarkdown(md_text)
 
     def _on_worker_done(self):
-        pass
+        if not self._from_current_worker():
+            return
+        # Render the whole answer once more so appended text gets full Markdown treatment (e.g. autolinks)
+        self._render_timer.stop()
+        self._flush_md(final=True)
 
     def _on_worker_error(self, err: str):
+        if not self._from_current_worker():
+            return
+        self._render_timer.stop()
         self.state = self.STATE_RESULT
-        self._md_buffer.clear()
+        self._md_text = ""
+        self._md_pending.clear()
         self.waiting.hide()
         self.preview.hide()
         self.result.setMarkdown(f"**Error:** {err}")
@@ -275,11 +509,16 @@ class Overlay(QWidget):
 
     # ---- Public controls ----
     def start(self):
+        # Screens don't move while the overlay is up, so look the desktop up once
+        self._vg = QGuiApplication.primaryScreen().virtualGeometry()
+        if self.geometry() != self._vg:
+            self.setGeometry(self._vg)
         self._snapshot_virtual_desktop()
 
         self.state = self.STATE_SELECTING
         self.dragging = False
         self.selection = QRect()
+        self._painted_sel = QRect()
         self._status_rect = None
 
         pg = self._primary_geom()
@@ -293,18 +532,25 @@ class Overlay(QWidget):
 
         self.show()
         self._focus_overlay()
-        self._md_buffer.clear()
+        self._md_text = ""
+        self._md_pending.clear()
         self.update()
 
     def finish(self):
+        self._detach_worker()
+        self._render_timer.stop()
+        self._repaint_timer.stop()
         self.releaseKeyboard()
         self.hide()
-        self._frozen_pm = None
+        self._screen_grabs = []
+        self._vg = QRect()
         self.state = self.STATE_IDLE
         self._status_rect = None
         self.dragging = False
         self.selection = QRect()
+        self._painted_sel = QRect()
         self._preview_pixmap = None
+        self._preview_scaled = None
 
         self.instruction.hide()
         self.waiting.hide()
@@ -330,7 +576,7 @@ class Overlay(QWidget):
         self.dragging = True
         self.start_pt = self.end_pt = gp
         self.selection = QRect(self.start_pt, self.end_pt).normalized()
-        self.update()
+        self._update_selection_area()
 
     def mouseMoveEvent(self, event):
         if self.state != self.STATE_SELECTING or not self.dragging:
@@ -338,7 +584,11 @@ class Overlay(QWidget):
         gp = event.globalPosition().toPoint() if hasattr(event, "globalPosition") else event.globalPos()
         self.end_pt = gp
         self.selection = QRect(self.start_pt, self.end_pt).normalized()
-        self.update()
+        # Mice can report at up to 1000 Hz; don't repaint faster than the screen refreshes
+        if time.monotonic_ns() - self._last_paint_ns > REPAINT_INTERVAL_MS * 1_000_000:
+            self._update_selection_area()
+        elif not self._repaint_timer.isActive():
+            self._repaint_timer.start()
 
     def mouseReleaseEvent(self, event):
         if self.state != self.STATE_SELECTING or event.button() != Qt.LeftButton:
@@ -347,37 +597,53 @@ class Overlay(QWidget):
         gp = event.globalPosition().toPoint() if hasattr(event, "globalPosition") else event.globalPos()
         self.end_pt = gp
         self.selection = QRect(self.start_pt, self.end_pt).normalized()
-        self.update()
+        self._update_selection_area()
+
+    def _update_selection_area(self):
+        """Repaint only where the selection was and is now, not the whole desktop."""
+        sel = QRect(self.mapFromGlobal(self.selection.topLeft()), self.selection.size())
+        dirty = QRegion()
+        for r in (self._painted_sel, sel):
+            if not r.isNull():
+                dirty = dirty.united(r.adjusted(-4, -4, 4, 4))  # room for the dashed border
+        self._painted_sel = sel
+        self.update(dirty)
 
     # ---- Drawing ----
-    def paintEvent(self, _event):
+    def paintEvent(self, event):
         if self.state == self.STATE_IDLE:
             return
+        self._last_paint_ns = time.monotonic_ns()
 
         p = QPainter(self)
         p.setRenderHint(QPainter.Antialiasing)
 
-        # Draw frozen desktop or a black fallback
-        if self._frozen_pm and not self._frozen_pm.isNull():
-            p.drawPixmap(0, 0, self._frozen_pm)
+        # Draw frozen desktop or a black fallback. Only screens touching the
+        # dirty rect are blitted; gaps between screens are never visible.
+        if self._screen_grabs:
+            dirty = event.rect()
+            for sg, _pm, dimmed in self._screen_grabs:
+                target = QRect(self.mapFromGlobal(sg.topLeft()), sg.size())
+                if target.intersects(dirty):
+                    p.drawPixmap(target, dimmed)
         else:
             p.fillRect(self.rect(), QColor(0, 0, 0, 255))
 
-        # Dim everything
-        alpha = 100 if self.state == self.STATE_SELECTING else 150
-        p.fillRect(self.rect(), QColor(0, 0, 0, alpha))
+        # Dim a bit more once the selection is done
+        if self.state != self.STATE_SELECTING:
+            p.fillRect(self.rect(), QColor(0, 0, 0, DIM_ALPHA_TOP_UP))
 
         # Unshade the selection during selection
-        if self.state == self.STATE_SELECTING and not self.selection.isNull() and self._frozen_pm and not self._frozen_pm.isNull():
+        if self.state == self.STATE_SELECTING and not self.selection.isNull() and self._screen_grabs:
             r_widget = QRect(self.mapFromGlobal(self.selection.topLeft()),
                              self.mapFromGlobal(self.selection.bottomRight())).normalized()
 
-            vg = QGuiApplication.primaryScreen().virtualGeometry()
             r_global = self.selection.normalized()
-            src = QRect(r_global.topLeft() - vg.topLeft(), r_global.size()).normalized()
-            src = src.intersected(QRect(0, 0, self._frozen_pm.width(), self._frozen_pm.height()))
-            if not src.isEmpty():
-                p.drawPixmap(r_widget, self._frozen_pm, src)
+            for sg, pm, _dimmed in self._screen_grabs:
+                part = r_global.intersected(sg)
+                if not part.isEmpty():
+                    p.drawPixmap(QRect(self.mapFromGlobal(part.topLeft()), part.size()), pm,
+                                 self._grab_source_rect(sg, pm, part))
 
             pen = QPen(Qt.white)
             pen.setWidth(2)
@@ -387,6 +653,9 @@ class Overlay(QWidget):
             p.drawRect(r_widget)
 
         p.end()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
         self.layoutFloatingWidgets()
 
     def layoutFloatingWidgets(self):
@@ -444,9 +713,12 @@ class Overlay(QWidget):
                 max_w = min(natural_max_w, int(max_h * aspect))
 
                 if self._preview_pixmap:
-                    pm = self._preview_pixmap.scaled(max_w, max_h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                    self.preview.setPixmap(pm)
-                    pw, ph = pm.width(), pm.height()
+                    if self._preview_scaled is None or self._preview_scaled_size != (max_w, max_h):
+                        self._preview_scaled = self._preview_pixmap.scaled(
+                            max_w, max_h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                        self._preview_scaled_size = (max_w, max_h)
+                        self.preview.setPixmap(self._preview_scaled)
+                    pw, ph = self._preview_scaled.width(), self._preview_scaled.height()
                 else:
                     pw, ph = max_w, max_h
 
@@ -465,58 +737,62 @@ class Overlay(QWidget):
 
     # ---- Capture & translate ----
     def _capture_and_translate(self):
-        if self.selection.isNull() or not self._frozen_pm or self._frozen_pm.isNull():
+        if self.selection.isNull() or not self._screen_grabs:
             return
 
-        sel = self.selection.normalized()
-        x, y, w, h = sel.x(), sel.y(), sel.width(), sel.height()
-
-        vg = QGuiApplication.primaryScreen().virtualGeometry()
-        vx = max(0, min(x - vg.x(), self._frozen_pm.width()  - 1))
-        vy = max(0, min(y - vg.y(), self._frozen_pm.height() - 1))
-        w  = max(1, min(w, self._frozen_pm.width()  - vx))
-        h  = max(1, min(h, self._frozen_pm.height() - vy))
-
-        pm = self._frozen_pm.copy(vx, vy, w, h)
+        sel = self.selection.normalized().intersected(self._vg)
+        if sel.isEmpty():
+            return
+        w, h = sel.width(), sel.height()
+
+        # Compose only the selected region from the screens it overlaps, straight
+        # into the opaque image that gets encoded
+        img = QImage(w, h, QImage.Format_RGB32)
+        p = QPainter(img)
+        covered = QRegion()
+        for sg, grab, _dimmed in self._screen_grabs:
+            part = sel.intersected(sg)
+            if not part.isEmpty():
+                target = QRect(part.topLeft() - sel.topLeft(), part.size())
+                p.drawPixmap(target, grab, self._grab_source_rect(sg, grab, part))
+                covered = covered.united(target)
+
+        # Black out only what no screen covers (usually nothing)
+        gaps = QRegion(img.rect()).subtracted(covered)
+        if not gaps.isEmpty():
+            p.setClipRegion(gaps)
+            p.fillRect(img.rect(), QColor(0, 0, 0, 255))
+        p.end()
 
         self.state = self.STATE_WAITING
         self.instruction.hide()
         self.waiting.show()
         self.preview.show()
         self.result.hide()
-        self._preview_pixmap = pm
+        self._preview_pixmap = QPixmap.fromImage(img)
+        self._preview_scaled = None
         self.layoutFloatingWidgets()
         self.update()
 
-        ba = QByteArray()
-        buf = QBuffer(ba)
-        buf.open(QIODevice.WriteOnly)
-        pm.save(buf, "PNG")
-        buf.close()
-        png_bytes = bytes(ba)
-
-        # Worker thread
-        self._thread = QThread(self)
-        self._worker = TranslatorWorker()
-        self._worker.moveToThread(self._thread)
-
-        self._thread.started.connect(lambda: self._worker.run(png_bytes))
-        self._worker.chunk.connect(self._on_worker_chunk)
-        self._worker.done.connect(self._on_worker_done)
-        self._worker.error.connect(self._on_worker_error)
-
-        # Clean up
-        self._worker.done.connect(self._thread.quit)
-        self._worker.error.connect(self._thread.quit)
-        self._thread.finished.connect(self._worker.deleteLater)
-        self._thread.finished.connect(self._thread.deleteLater)
-        self._thread.start()
+        # Downscaling and encoding happen on the worker thread
+        self._detach_worker()
+        self._worker = TranslatorWorker(img)
+        self._worker.signals.chunk.connect(self._on_worker_chunk)
+        self._worker.signals.done.connect(self._on_worker_done)
+        self._worker.signals.error.connect(self._on_worker_error)
+        QThreadPool.globalInstance().start(self._worker)
 
 
 class TrayApp(QApplication):
     def __init__(self, argv):
         super().__init__(argv)
         self.setQuitOnLastWindowClosed(False)
+        # Translation threads are never retired (the default expiry is 30 s); the
+        # HTTP connection is kept warm separately by the client (KEEPALIVE_EXPIRY_S)
+        pool = QThreadPool.globalInstance()
+        pool.setMaxThreadCount(2)
+        pool.setExpiryTimeout(-1)
+        pool.start(warm_up_client)
 
         # Tray
         self.tray = QSystemTrayIcon(self)
@@ -539,16 +815,10 @@ class TrayApp(QApplication):
         self.overlay.requestClose.connect(self.on_overlay_closed)
 
         # Register Ctrl+Alt+PrintScreen (fallback to Ctrl+Alt+F9)
-        self._hotkey_filter = WinHotkeyFilter(self.trigger_selection)
-        self.installNativeEventFilter(self._hotkey_filter)
-
-        ok = RegisterHotKey(None, HOTKEY_ID, MOD_CONTROL | MOD_ALT, VK_SNAPSHOT)
-        if not ok:
-            VK_F9 = 0x78
-            ok = RegisterHotKey(None, HOTKEY_ID, MOD_CONTROL | MOD_ALT, VK_F9)
-            self.tray.setToolTip("Image → Portuguese (Ctrl+Alt+F9)" if ok else "Image → Portuguese (no hotkey registered)")
-        else:
-            self.tray.setToolTip("Image → Portuguese (Ctrl+Alt+PrtScr)")
+        self._hotkey_thread = WinHotkeyThread(self)
+        self._hotkey_thread.activated.connect(self.trigger_selection)
+        self._hotkey_thread.registered.connect(self._on_hotkey_registered)
+        self._hotkey_thread.start()
 
         self.aboutToQuit.connect(self._cleanup_hotkey)
 
@@ -556,13 +826,14 @@ class TrayApp(QApplication):
         if reason in (QSystemTrayIcon.Trigger, QSystemTrayIcon.DoubleClick):
             self.trigger_selection()
 
+    def _on_hotkey_registered(self, name: str):
+        self.tray.setToolTip(f"Image → Portuguese ({name or 'no hotkey registered'})")
+
     def _cleanup_hotkey(self):
-        UnregisterHotKey(None, HOTKEY_ID)
+        self._hotkey_thread.stop()
 
     def trigger_selection(self):
         if self.overlay.state == self.overlay.STATE_IDLE:
-            vg = QGuiApplication.primaryScreen().virtualGeometry()
-            self.overlay.setGeometry(vg)
             self.overlay.start()
 
     def on_overlay_closed(self):